@@ -4,9 +4,11 @@
 """Connection/Session management module."""
 
 import asyncio
+from collections import deque
 import json
 import logging
-from typing import Awaitable, Callable, Dict, Union, TYPE_CHECKING
+from typing import Awaitable, Callable, Deque, Dict, Tuple, Union
+from typing import TYPE_CHECKING
 
 from pyee import EventEmitter
 import websockets
@@ -43,6 +45,8 @@ class Connection(EventEmitter):
         self._ws = websockets.client.connect(
             self._url, max_size=None, loop=self._loop)
         self._recv_fut = self._loop.create_task(self._recv_loop())
+        self._send_queue: Deque[Tuple[str, int]] = deque()
+        self._send_fut: Optional[asyncio.Future] = None
         self._closeCallback: Optional[Callable[[], None]] = None
 
     @property
@@ -66,17 +70,22 @@ class Connection(EventEmitter):
         if self._connected:
             self._loop.create_task(self.dispose())
 
-    async def _async_send(self, msg: str, callback_id: int) -> None:
+    async def _send_loop(self) -> None:
+        # Write all queued messages in order. Messages queued while writing
+        # are sent by this loop too, so a burst of messages is flushed by a
+        # single task.
         while not self._connected:
             await asyncio.sleep(self._delay)
-        try:
-            await self.connection.send(msg)
-        except websockets.ConnectionClosed:
-            logger.error('connection unexpectedly closed')
-            callback = self._callbacks.get(callback_id, None)
-            if callback and not callback.done():
-                callback.set_result(None)
-                await self.dispose()
+        while self._send_queue:
+            msg, callback_id = self._send_queue.popleft()
+            try:
+                await self.connection.send(msg)
+            except websockets.ConnectionClosed:
+                logger.error('connection unexpectedly closed')
+                callback = self._callbacks.pop(callback_id, None)
+                if callback and not callback.done():
+                    callback.set_result(None)
+                    await self.dispose()
 
     def send(self, method: str, params: dict = None) -> Awaitable:
         """Send message via the connection."""
@@ -93,7 +102,9 @@ class Connection(EventEmitter):
             params=params,
         ))
         logger_connection.debug(f'SEND: {msg}')
-        self._loop.create_task(self._async_send(msg, _id))
+        self._send_queue.append((msg, _id))
+        if self._send_fut is None or self._send_fut.done():
+            self._send_fut = self._loop.create_task(self._send_loop())
         callback = self._loop.create_future()
         self._callbacks[_id] = callback
         callback.error: Exception = NetworkError()  # type: ignore
@@ -163,6 +174,7 @@ class Connection(EventEmitter):
             await self.connection.close()
         if not self._recv_fut.done():
             self._recv_fut.cancel()
+        self._send_queue.clear()
 
     async def dispose(self) -> None:
         """Close all connection."""
@@ -4,15 +4,87 @@
 """Keyboard and Mouse module."""
 
 import asyncio
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Awaitable, Dict, List, NamedTuple, Optional, Tuple
 
 from pyppeteer.connection import CDPSession
 from pyppeteer.errors import PyppeteerError
 from pyppeteer.us_keyboard_layout import keyDefinitions
 from pyppeteer.util import merge_dict
 
-if TYPE_CHECKING:
-    from typing import Set  # noqa: F401
+_MODIFIER_BITS = {'Alt': 1, 'Control': 2, 'Meta': 4, 'Shift': 8}
+
+_DEFAULT_BUTTON = 'left'
+_DEFAULT_CLICK_COUNT = 1
+
+# Bit assigned to each key code, used to track pressed keys in an int mask.
+# Definitions without code are described with an empty code.
+_CODE_BITS = {code: 1 << i for i, code in enumerate(sorted({
+    definition.get('code', '')  # type: ignore
+    for definition in keyDefinitions.values()
+}))}
+
+# Messages are serialized on send, so an immutable empty sequence can be
+# shared by every touchend event.
+_NO_TOUCH_POINTS = ()
+
+
+_KeyDescription = NamedTuple('_KeyDescription', [
+    ('key', str),
+    ('keyCode', int),
+    ('code', str),
+    ('text', str),
+    ('location', int),
+])
+
+
+def _describeKey(keyString: str, shift: bool, hasNonShiftMods: bool
+                 ) -> _KeyDescription:
+    definition: Dict = keyDefinitions.get(keyString)  # type: ignore
+    if not definition:
+        raise PyppeteerError(f'Unknown key: {keyString}')
+
+    key = definition.get('key', '')
+    keyCode = definition.get('keyCode', 0)
+    if shift:
+        key = definition.get('shiftKey') or key
+        keyCode = definition.get('shiftKeyCode') or keyCode
+    text = definition.get('text', key if len(key) == 1 else '')
+    if shift:
+        text = definition.get('shiftText') or text
+    if hasNonShiftMods:
+        text = ''
+
+    return _KeyDescription(
+        key=key,
+        keyCode=keyCode,
+        code=definition.get('code', ''),
+        text=text,
+        location=definition.get('location', 0),
+    )
+
+
+def _buildKeyEventTemplates() -> Tuple[Dict, Dict]:
+    # Static parts of keydown/keyup event payloads, keyed by key name and the
+    # shift state, which are the only inputs they depend on.
+    downTemplates: Dict[Tuple[str, bool], Dict] = dict()
+    upTemplates: Dict[Tuple[str, bool], Dict] = dict()
+    for key in keyDefinitions:
+        for shift in (False, True):
+            description = _describeKey(key, shift, False)
+            upTemplates[key, shift] = {
+                'key': description.key,
+                'windowsVirtualKeyCode': description.keyCode,
+                'code': description.code,
+                'location': description.location,
+            }
+            downTemplates[key, shift] = dict(
+                upTemplates[key, shift],
+                isKeypad=description.location == 3,
+            )
+    return downTemplates, upTemplates
+
+
+_keyDownTemplates, _keyUpTemplates = _buildKeyEventTemplates()
 
 
 class Keyboard(object):
@@ -50,10 +122,25 @@ class Keyboard(object):
         await page.keyboard.up('Shift')
     """
 
+    __slots__ = ('_client', '_modifiers', '_shift', '_hasNonShiftMods',
+                 '_pressedKeysMask', '_descCache')
+
     def __init__(self, client: CDPSession) -> None:
         self._client = client
         self._modifiers = 0
-        self._pressedKeys: Set[str] = set()
+        self._shift = False
+        self._hasNonShiftMods = False
+        self._pressedKeysMask = 0
+        self._descCache: Dict[Tuple[str, bool, bool], _KeyDescription] = dict()
+
+    @property
+    def modifiers(self) -> int:
+        """Get bit flags of currently pressed modifier keys.
+
+        ``Alt``, ``Control``, ``Meta``, and ``Shift`` are ``1``, ``2``, ``4``,
+        and ``8`` respectively.
+        """
+        return self._modifiers
 
     async def down(self, key: str, options: dict = None, **kwargs: Any
                    ) -> None:
@@ -77,81 +164,42 @@ class Keyboard(object):
             will type the text in upper case.
         """
         options = merge_dict(options, kwargs)
-
+        shift = self._shift
         description = self._keyDescriptionForString(key)
-        autoRepeat = description['code'] in self._pressedKeys
-        self._pressedKeys.add(description['code'])
-        self._modifiers |= self._modifierBit(description['key'])
+        await self._dispatchKeyDown(key, shift, description,
+                                    options.get('text'))
+
+    def _dispatchKeyDown(self, key: str, shift: bool,
+                         description: _KeyDescription,
+                         text: Optional[str] = None) -> Awaitable:
+        codeBit = _CODE_BITS[description.code]
+        autoRepeat = bool(self._pressedKeysMask & codeBit)
+        self._pressedKeysMask |= codeBit
+        self._modifiers |= _MODIFIER_BITS.get(description.key, 0)
+        self._shift = bool(self._modifiers & 8)
+        self._hasNonShiftMods = bool(self._modifiers & ~8)
 
-        text = options.get('text')
         if text is None:
-            text = description['text']
-
-        await self._client.send('Input.dispatchKeyEvent', {
-            'type': 'keyDown' if text else 'rawKeyDown',
-            'modifiers': self._modifiers,
-            'windowsVirtualKeyCode': description['keyCode'],
-            'code': description['code'],
-            'key': description['key'],
-            'text': text,
-            'unmodifiedText': text,
-            'autoRepeat': autoRepeat,
-            'location': description['location'],
-            'isKeypad': description['location'] == 3,
-        })
-
-    def _modifierBit(self, key: str) -> int:
-        if key == 'Alt':
-            return 1
-        if key == 'Control':
-            return 2
-        if key == 'Meta':
-            return 4
-        if key == 'Shift':
-            return 8
-        return 0
-
-    def _keyDescriptionForString(self, keyString: str) -> Dict:  # noqa: C901
-        shift = self._modifiers & 8
-        description = {
-            'key': '',
-            'keyCode': 0,
-            'code': '',
-            'text': '',
-            'location': 0,
-        }
-
-        definition: Dict = keyDefinitions.get(keyString)  # type: ignore
-        if not definition:
-            raise PyppeteerError(f'Unknown key: {keyString}')
-
-        if 'key' in definition:
-            description['key'] = definition['key']
-        if shift and definition.get('shiftKey'):
-            description['key'] = definition['shiftKey']
-
-        if 'keyCode' in definition:
-            description['keyCode'] = definition['keyCode']
-        if shift and definition.get('shiftKeyCode'):
-            description['keyCode'] = definition['shiftKeyCode']
-
-        if 'code' in definition:
-            description['code'] = definition['code']
-
-        if 'location' in definition:
-            description['location'] = definition['location']
-
-        if len(description['key']) == 1:  # type: ignore
-            description['text'] = description['key']
-
-        if 'text' in definition:
-            description['text'] = definition['text']
-        if shift and definition.get('shiftText'):
-            description['text'] = definition['shiftText']
-
-        if self._modifiers & ~8:
-            description['text'] = ''
-
+            text = description.text
+
+        params = _keyDownTemplates[key, shift].copy()
+        params['type'] = 'keyDown' if text else 'rawKeyDown'
+        params['modifiers'] = self._modifiers
+        params['text'] = text
+        params['unmodifiedText'] = text
+        params['autoRepeat'] = autoRepeat
+        return self._client.send('Input.dispatchKeyEvent', params)
+
+    def _keyDescriptionForString(self, keyString: str
+                                 ) -> _KeyDescription:
+        # description depends only on the key and the modifier state, so cache
+        # it to avoid rebuilding the same dict on every key press.
+        cacheKey = (keyString, self._shift, self._hasNonShiftMods)
+        description = self._descCache.get(cacheKey)
+        if description is None:
+            description = _describeKey(keyString, self._shift,
+                                       self._hasNonShiftMods)
+            self._descCache[cacheKey] = description
         return description
 
     async def up(self, key: str) -> None:
@@ -159,19 +207,20 @@ class Keyboard(object):
 
         :arg str key: Name of key to release, such as ``ArrowLeft``.
         """
+        shift = self._shift
         description = self._keyDescriptionForString(key)
-
-        self._modifiers &= ~self._modifierBit(description['key'])
-        if description['code'] in self._pressedKeys:
-            self._pressedKeys.remove(description['code'])
-        await self._client.send('Input.dispatchKeyEvent', {
-            'type': 'keyUp',
-            'modifiers': self._modifiers,
-            'key': description['key'],
-            'windowsVirtualKeyCode': description['keyCode'],
-            'code': description['code'],
-            'location': description['location'],
-        })
+        await self._dispatchKeyUp(key, shift, description)
+
+    def _dispatchKeyUp(self, key: str, shift: bool,
+                       description: _KeyDescription) -> Awaitable:
+        self._modifiers &= ~_MODIFIER_BITS.get(description.key, 0)
+        self._shift = bool(self._modifiers & 8)
+        self._hasNonShiftMods = bool(self._modifiers & ~8)
+        self._pressedKeysMask &= ~_CODE_BITS[description.code]
+        params = _keyUpTemplates[key, shift].copy()
+        params['type'] = 'keyUp'
+        params['modifiers'] = self._modifiers
+        return self._client.send('Input.dispatchKeyEvent', params)
 
     async def sendCharacter(self, char: str) -> None:
         """Send character into the page.
@@ -206,13 +255,35 @@ class Keyboard(object):
         """
         options = merge_dict(options, kwargs)
         delay = options.get('delay', 0)
+        if not delay:
+            await self._typeWithoutDelay(text)
+            return
+        pressOptions = {'delay': delay}
         for char in text:
             if char in keyDefinitions:
-                await self.press(char, {'delay': delay})
+                await self.press(char, pressOptions)
             else:
                 await self.sendCharacter(char)
-            if delay:
-                await asyncio.sleep(delay / 1000)
+            await asyncio.sleep(delay / 1000)
+
+    async def _typeWithoutDelay(self, text: str) -> None:
+        # Events are dispatched in order, so there is no need to wait for the
+        # response of each event before sending the next one.
+        # bind loop-invariant methods once instead of on every character
+        describe = self._keyDescriptionForString
+        keyDown = self._dispatchKeyDown
+        keyUp = self._dispatchKeyUp
+        send = self._client.send
+        futures = []
+        for char in text:
+            if char in keyDefinitions:
+                shift = self._shift
+                description = describe(char)
+                futures.append(keyDown(char, shift, description))
+                futures.append(keyUp(char, shift, description))
+            else:
+                futures.append(send('Input.insertText', {'text': char}))
+        await asyncio.gather(*futures)
 
     async def press(self, key: str, options: Dict = None, **kwargs: Any
                     ) -> None:
@@ -238,10 +309,20 @@ class Keyboard(object):
         """
         options = merge_dict(options, kwargs)
 
-        await self.down(key, options)
-        if 'delay' in options:
-            await asyncio.sleep(options['delay'] / 1000)
-        await self.up(key)
+        # keyup is described the same as keydown, so describe the key once
+        shift = self._shift
+        description = self._keyDescriptionForString(key)
+        keyDown = self._dispatchKeyDown(key, shift, description,
+                                        options.get('text'))
+        delay = options.get('delay')
+        if not delay:
+            # no need to wait for keydown before sending keyup
+            await asyncio.gather(
+                keyDown, self._dispatchKeyUp(key, shift, description))
+            return
+        await keyDown
+        await asyncio.sleep(delay / 1000)
+        await self._dispatchKeyUp(key, shift, description)
 
 
 class Mouse(object):
@@ -251,6 +332,8 @@ class Mouse(object):
     top-left corner of the viewport.
     """
 
+    __slots__ = ('_client', '_keyboard', '_x', '_y', '_button')
+
     def __init__(self, client: CDPSession, keyboard: Keyboard) -> None:
         self._client = client
         self._keyboard = keyboard
@@ -266,21 +349,34 @@ class Mouse(object):
         specified, Sends intermediate ``mousemove`` events. Defaults to 1.
         """
         options = merge_dict(options, kwargs)
+        steps = options.get('steps', 1)
+        # intermediate events are dispatched in order, so wait all at once
+        await asyncio.gather(*self._dispatchMove(x, y, steps))
+
+    def _dispatchMove(self, x: float, y: float, steps: int
+                      ) -> List[Awaitable]:
         fromX = self._x
         fromY = self._y
         self._x = x
         self._y = y
-        steps = options.get('steps', 1)
+        deltaX = x - fromX
+        deltaY = y - fromY
+        # send() serializes params immediately, so only the coordinates need
+        # to be updated for each step.
+        params = {
+            'type': 'mouseMoved',
+            'button': self._button,
+            'x': 0,
+            'y': 0,
+            'modifiers': self._keyboard.modifiers,
+        }
+        futures = []
         for i in range(1, steps + 1):
-            x = round(fromX + (self._x - fromX) * (i / steps))
-            y = round(fromY + (self._y - fromY) * (i / steps))
-            await self._client.send('Input.dispatchMouseEvent', {
-                'type': 'mouseMoved',
-                'button': self._button,
-                'x': x,
-                'y': y,
-                'modifiers': self._keyboard._modifiers,
-            })
+            params['x'] = round(fromX + deltaX * (i / steps))
+            params['y'] = round(fromY + deltaY * (i / steps))
+            futures.append(
+                self._client.send('Input.dispatchMouseEvent', params))
+        return futures
 
     async def click(self, x: float, y: float, options: dict = None,
                     **kwargs: Any) -> None:
@@ -297,11 +393,16 @@ class Mouse(object):
           ``mouseup`` in milliseconds. Defaults to 0.
         """
         options = merge_dict(options, kwargs)
-        await self.move(x, y)
-        await self.down(options)
-        if options and options.get('delay'):
-            await asyncio.sleep(options.get('delay', 0) / 1000)
-        await self.up(options)
+        futures = self._dispatchMove(x, y, 1)
+        futures.append(self._dispatchDown(options))
+        if options.get('delay'):
+            await asyncio.gather(*futures)
+            await asyncio.sleep(options['delay'] / 1000)
+            await self._dispatchUp(options)
+        else:
+            # send all events without waiting for each response
+            futures.append(self._dispatchUp(options))
+            await asyncio.gather(*futures)
 
     async def down(self, options: dict = None, **kwargs: Any) -> None:
         """Press down button (dispatches ``mousedown`` event).
@@ -313,14 +414,18 @@ class Mouse(object):
         * ``clickCount`` (int): defaults to 1.
         """
         options = merge_dict(options, kwargs)
-        self._button = options.get('button', 'left')
-        await self._client.send('Input.dispatchMouseEvent', {
+        await self._dispatchDown(options)
+
+    def _dispatchDown(self, options: Dict) -> Awaitable:
+        self._button = options.get('button', _DEFAULT_BUTTON)
+        clickCount = options.get('clickCount', _DEFAULT_CLICK_COUNT)
+        return self._client.send('Input.dispatchMouseEvent', {
             'type': 'mousePressed',
             'button': self._button,
             'x': self._x,
             'y': self._y,
-            'modifiers': self._keyboard._modifiers,
-            'clickCount': options.get('clickCount') or 1,
+            'modifiers': self._keyboard.modifiers,
+            'clickCount': clickCount,
         })
 
     async def up(self, options: dict = None, **kwargs: Any) -> None:
@@ -329,24 +434,34 @@ class Mouse(object):
         This method accepts the following options:
 
         * ``button`` (str): ``left``, ``right``, or ``middle``, defaults to
-          ``left``.
+          the button pressed by :meth:`down`, or ``left`` if no button is
+          pressed.
         * ``clickCount`` (int): defaults to 1.
         """
         options = merge_dict(options, kwargs)
+        await self._dispatchUp(options)
+
+    def _dispatchUp(self, options: Dict) -> Awaitable:
+        # release the pressed button unless other button is specified
+        pressed = self._button if self._button != 'none' else _DEFAULT_BUTTON
+        button = options.get('button', pressed)
+        clickCount = options.get('clickCount', _DEFAULT_CLICK_COUNT)
         self._button = 'none'
-        await self._client.send('Input.dispatchMouseEvent', {
+        return self._client.send('Input.dispatchMouseEvent', {
             'type': 'mouseReleased',
-            'button': options.get('button', 'left'),
+            'button': button,
             'x': self._x,
             'y': self._y,
-            'modifiers': self._keyboard._modifiers,
-            'clickCount': options.get('clickCount') or 1,
+            'modifiers': self._keyboard.modifiers,
+            'clickCount': clickCount,
         })
 
 
 class Touchscreen(object):
     """Touchscreen class."""
 
+    __slots__ = ('_client', '_keyboard')
+
     def __init__(self, client: CDPSession, keyboard: Keyboard) -> None:
         """Make new touchscreen object."""
         self._client = client
@@ -357,14 +472,19 @@ class Touchscreen(object):
 
         Dispatches a ``touchstart`` and ``touchend`` event.
         """
+        modifiers = self._keyboard.modifiers
         touchPoints = [{'x': round(x), 'y': round(y)}]
-        await self._client.send('Input.dispatchTouchEvent', {
-            'type': 'touchStart',
-            'touchPoints': touchPoints,
-            'modifiers': self._keyboard._modifiers,
-        })
-        await self._client.send('Input.dispatchTouchEvent', {
-            'type': 'touchEnd',
-            'touchPoints': [],
-            'modifiers': self._keyboard._modifiers,
-        })
+        # touchend does not depend on the result of touchstart, so send both
+        # and wait for them together.
+        await asyncio.gather(
+            self._client.send('Input.dispatchTouchEvent', {
+                'type': 'touchStart',
+                'touchPoints': touchPoints,
+                'modifiers': modifiers,
+            }),
+            self._client.send('Input.dispatchTouchEvent', {
+                'type': 'touchEnd',
+                'touchPoints': _NO_TOUCH_POINTS,
+                'modifiers': modifiers,
+            }),
+        )
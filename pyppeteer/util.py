@@ -32,9 +32,8 @@ def get_free_port() -> int:
 
 def merge_dict(dict1: Optional[Dict], dict2: Optional[Dict]) -> Dict:
     """Merge two dictionaries into new one."""
-    new_dict = {}
-    if dict1:
-        new_dict.update(dict1)
-    if dict2:
-        new_dict.update(dict2)
-    return new_dict
+    if not dict1:
+        return dict(dict2) if dict2 else {}
+    if not dict2:
+        return dict(dict1)
+    return {**dict1, **dict2}
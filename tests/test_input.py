@@ -248,6 +248,18 @@ class TestClick(BaseTestCase):
         self.assertEqual(await self.page.evaluate(
             'document.querySelector("#button-8").textContent'), 'context menu')
 
+    @sync
+    async def test_mouse_up_pressed_button(self):
+        await self.page.evaluate('''() => {
+                window.result = [];
+                document.addEventListener('mouseup', event => {
+                    window.result.push(event.button);
+                });
+            }''')
+        await self.page.mouse.down(button='middle')
+        await self.page.mouse.up()
+        self.assertEqual(await self.page.evaluate('window.result'), [1])
+
     @sync
     async def test_click_with_modifier_key(self):
         await self.page.goto(self.url + 'static/scrollable.html')
@@ -554,15 +566,15 @@ window.addEventListener('keydown', event => {
     @sync
     async def test_key_modifiers(self):
         keyboard = self.page.keyboard
-        self.assertEqual(keyboard._modifiers, 0)
+        self.assertEqual(keyboard.modifiers, 0)
         await keyboard.down('Shift')
-        self.assertEqual(keyboard._modifiers, 8)
+        self.assertEqual(keyboard.modifiers, 8)
         await keyboard.down('Alt')
-        self.assertEqual(keyboard._modifiers, 9)
+        self.assertEqual(keyboard.modifiers, 9)
         await keyboard.up('Shift')
-        self.assertEqual(keyboard._modifiers, 1)
+        self.assertEqual(keyboard.modifiers, 1)
         await keyboard.up('Alt')
-        self.assertEqual(keyboard._modifiers, 0)
+        self.assertEqual(keyboard.modifiers, 0)
 
     @sync
     async def test_repeat_properly(self):